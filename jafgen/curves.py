@@ -8,6 +8,11 @@ from typing_extensions import override
 NumberArr = npt.NDArray[np.float64] | npt.NDArray[np.int32]
 
 
+def _frozen(arr: NumberArr) -> NumberArr:
+    """Mark a domain array read-only, since one copy is shared by every call."""
+    arr.flags.writeable = False
+    return arr
+
 
 class Curve(ABC):
     @property
@@ -23,20 +28,21 @@ class Curve(ABC):
     def Expr(self, x: float) -> float:
         raise NotImplementedError
 
-    @classmethod
-    def eval(cls, date: datetime.date) -> float:
-        instance = cls()
-        domain_value = instance.TranslateDomain(date)
-        domain_index = domain_value % len(instance.Domain)
-        translated_value = instance.Domain[domain_index]
-        return instance.Expr(translated_value)
+    def eval(self, date: datetime.date) -> float:
+        domain = self.Domain
+        domain_value = self.TranslateDomain(date)
+        domain_index = domain_value % len(domain)
+        translated_value = domain[domain_index]
+        return self.Expr(translated_value)
 
 
 class AnnualCurve(Curve):
+    _DOMAIN = _frozen(np.linspace(0, 2 * np.pi, 365, dtype=np.float64))
+
     @property
     @override
     def Domain(self) -> NumberArr:
-        return np.linspace(0, 2 * np.pi, 365, dtype=np.float64)
+        return self._DOMAIN
 
     @override
     def TranslateDomain(self, date: datetime.date) -> int:
@@ -48,9 +54,11 @@ class AnnualCurve(Curve):
 
 
 class WeekendCurve(Curve):
+    _DOMAIN = _frozen(np.array(range(6), dtype=np.float64))
+
     @property
     def Domain(self) -> NumberArr:
-        return np.array(range(6), dtype=np.float64)
+        return self._DOMAIN
 
     def TranslateDomain(self, date: datetime.date) -> int:
         return date.weekday() - 1
@@ -63,9 +71,11 @@ class WeekendCurve(Curve):
 
 
 class GrowthCurve(Curve):
+    _DOMAIN = _frozen(np.arange(500, dtype=np.int32))
+
     @property
     def Domain(self) -> NumberArr:
-        return np.arange(500, dtype=np.int32)
+        return self._DOMAIN
 
     def TranslateDomain(self, date: datetime.date) -> int:
         return (date.year - 2016) * 12 + date.month
@@ -4,17 +4,15 @@ from dataclasses import dataclass, field
 from typing import Any, NewType
 
 import numpy as np
-from faker import Faker
 
 from jafgen.customers.order import Order
 from jafgen.customers.tweet import Tweet
+from jafgen.fake import fake
 from jafgen.stores.inventory import Inventory
 from jafgen.stores.item import Item, ItemType
 from jafgen.stores.store import Store
 from jafgen.time import Day, Season
 
-fake = Faker()
-
 CustomerId = NewType("CustomerId", uuid.UUID)
 
 @dataclass(frozen=True)
@@ -78,11 +76,18 @@ class Customer(ABC):
     def get_order_minute(self, day: Day) -> int:
         raise NotImplementedError()
 
-    def sim_day(self, day: Day):
+    def sim_day(
+        self,
+        day: Day,
+        p_buy_threshold: float | None = None,
+        p_tweet_threshold: float | None = None,
+    ):
         p_buy = self.p_buy(day)
-        p_buy_threshold = np.random.random()
+        if p_buy_threshold is None:
+            p_buy_threshold = np.random.random()
         p_tweet = self.p_tweet(day)
-        p_tweet_threshold = np.random.random()
+        if p_tweet_threshold is None:
+            p_tweet_threshold = np.random.random()
         if p_buy > p_buy_threshold:
             if p_tweet > p_tweet_threshold:
                 order = self.get_order(day)
@@ -2,15 +2,12 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any, NewType
 
-from faker import Faker
-
 import jafgen.customers.customers as customer
+from jafgen.fake import fake
 from jafgen.stores.item import Item
 from jafgen.stores.store import Store
 from jafgen.time import Day
 
-fake = Faker()
-
 OrderId = NewType("OrderId", uuid.UUID)
 
 @dataclass
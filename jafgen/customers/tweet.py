@@ -2,16 +2,44 @@ import uuid
 from dataclasses import dataclass, field
 from typing import NewType
 
-from faker import Faker
-
 import jafgen.customers.customers as customer
 from jafgen.customers.order import Order
+from jafgen.fake import fake
 from jafgen.time import Day
 
-fake = Faker()
-
 TweetId = NewType("TweetId", uuid.UUID)
 
+FAN_ADJECTIVES = (
+    "the best",
+    "awesome",
+    "delicious",
+    "amazing",
+    "fantastic",
+    "sooo gooood",
+    "my favorite",
+)
+
+HATER_ADJECTIVES = (
+    "terrible",
+    "the worst",
+    "awful",
+    "disgusting",
+    "gross",
+    "inedible",
+    "my least favorite",
+)
+
+NEUTRAL_ADJECTIVES = (
+    "okay",
+    "fine",
+    "alright",
+    "average",
+    "pretty decent",
+    "solid",
+    "not bad",
+    "just meh",
+)
+
 
 @dataclass
 class Tweet:
@@ -40,42 +68,11 @@ class Tweet:
         else:
             items_sentence = f"Ordered a {', a '.join(item.name for item in self.order.items[:-1])}, and a {self.order.items[-1].name}"
         if self.customer.fan_level > 3:
-            adjective = fake.random.choice(
-                [
-                    "the best",
-                    "awesome",
-                    "delicious",
-                    "amazing",
-                    "fantastic",
-                    "sooo gooood",
-                    "my favorite",
-                ]
-            )
+            adjective = fake.random.choice(FAN_ADJECTIVES)
             return f"Jaffles from the Jaffle Shop are {adjective}! {items_sentence}."
         elif self.customer.fan_level < 3:
-            adjective = fake.random.choice(
-                [
-                    "terrible",
-                    "the worst",
-                    "awful",
-                    "disgusting",
-                    "gross",
-                    "inedible",
-                    "my least favorite",
-                ]
-            )
+            adjective = fake.random.choice(HATER_ADJECTIVES)
             return f"Jaffle Shop again. {items_sentence}. This place is {adjective}."
         else:
-            adjective = fake.random.choice(
-                [
-                    "okay",
-                    "fine",
-                    "alright",
-                    "average",
-                    "pretty decent",
-                    "solid",
-                    "not bad",
-                    "just meh",
-                ]
-            )
+            adjective = fake.random.choice(NEUTRAL_ADJECTIVES)
             return f"Jaffle shop is {adjective}. {items_sentence}."
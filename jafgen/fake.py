@@ -0,0 +1,4 @@
+from faker import Faker
+
+# one shared instance, building a Faker loads every provider
+fake = Faker()
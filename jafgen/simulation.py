@@ -1,6 +1,7 @@
+import contextlib
 import csv
 import os
-from typing import Any
+from typing import Any, Iterable
 
 from rich.progress import track
 
@@ -23,6 +24,9 @@ T_8AM = time_from_total_minutes(60 * 8)
 T_3PM = time_from_total_minutes(60 * 15)
 T_8PM = time_from_total_minutes(60 * 20)
 
+# write CSVs through a 1 MiB buffer instead of the default 8 KiB one
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
 class Simulation:
     def __init__(self, years: int, prefix: str):
         self.years = years
@@ -77,24 +81,45 @@ class Simulation:
     def save_results(self) -> None:
         stock: Stock = Stock()
         inventory: Inventory = Inventory()
-        entities: dict[str, list[dict[str, Any]]] = {
-            "customers": [customer.to_dict() for customer in self.customers.values()],
-            "orders": [order.to_dict() for order in self.orders],
-            "items": [item.to_dict() for order in self.orders for item in order.items],
-            "stores": [market.store.to_dict() for market in self.markets],
+        # rows are built lazily while writing instead of all up front
+        entities: dict[str, Iterable[dict[str, Any]]] = {
+            "customers": (customer.to_dict() for customer in self.customers.values()),
+            "orders": (order.to_dict() for order in self.orders),
+            "items": (item.to_dict() for order in self.orders for item in order.items),
+            "stores": (market.store.to_dict() for market in self.markets),
             "supplies": stock.to_dict(),
             "products": inventory.to_dict(),
-            "tweets": [tweet.to_dict() for tweet in self.tweets],
+            "tweets": (tweet.to_dict() for tweet in self.tweets),
         }
 
-        if not os.path.exists("./jaffle-data"):
-            os.makedirs("./jaffle-data")
+        output_dir = "./jaffle-data"
+        os.makedirs(output_dir, exist_ok=True)
         for entity, data in track(
             entities.items(), description="🚚 Delivering jaffles..."
         ):
-            with open(
-                f"./jaffle-data/{self.prefix}_{entity}.csv", "w", newline=""
-            ) as file:
-                writer = csv.DictWriter(file, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
+            path = os.path.join(output_dir, f"{self.prefix}_{entity}.csv")
+            rows = iter(data)
+            first_row = next(rows, None)
+            # nothing to write (e.g. no tweets yet) and no header to infer, but
+            # a file from an earlier run must not linger next to the new ones
+            if first_row is None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+                continue
+            # write next to the target and only swap it in once complete, so a
+            # failed write never replaces the CSV at `path`; the partial temp
+            # file is removed (a hard kill can still leave a stray .tmp)
+            tmp_path = f"{path}.tmp"
+            try:
+                with open(
+                    tmp_path, "w", newline="", buffering=CSV_WRITE_BUFFER_SIZE
+                ) as file:
+                    writer = csv.DictWriter(file, fieldnames=first_row.keys())
+                    writer.writeheader()
+                    writer.writerow(first_row)
+                    writer.writerows(rows)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+                raise
+            os.replace(tmp_path, path)
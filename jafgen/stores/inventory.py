@@ -1,12 +1,9 @@
 from typing import Any
 
-from faker import Faker
-
+from jafgen.fake import fake
 from jafgen.stores.item import Item, ItemType
 from jafgen.stores.supply import StorageKeepingUnit as SKU
 
-fake = Faker()
-
 
 class Inventory:
     inventory: dict[ItemType, list[Item]] = {}
@@ -20,7 +17,7 @@ class Inventory:
 
     @classmethod
     def get_item_type(cls, type: ItemType, count: int = 1):
-        return [fake.random.choice(cls.inventory[type])for _ in range(count)]
+        return fake.random.choices(cls.inventory[type], k=count)
 
     @classmethod
     def to_dict(cls) -> list[dict[str, Any]]:
@@ -1,7 +1,6 @@
 from typing import Iterator
 
 import numpy as np
-from faker import Faker
 
 from jafgen.customers.customers import (
     BrunchCrowd,
@@ -14,10 +13,10 @@ from jafgen.customers.customers import (
 )
 from jafgen.customers.order import Order
 from jafgen.customers.tweet import Tweet
+from jafgen.fake import fake
 from jafgen.stores.store import Store
 from jafgen.time import Day
 
-fake = Faker()
 
 class Market:
     PersonaMix = [
@@ -63,6 +62,10 @@ class Market:
             customer = self.addressable_customers.pop()
             self.active_customers.append(customer)
 
-        for customer in self.active_customers:
-            order, tweet = customer.sim_day(day)
+        # draw every active customer's buy and tweet thresholds in one call
+        thresholds = np.random.random((len(self.active_customers), 2)).tolist()
+        for customer, (p_buy_threshold, p_tweet_threshold) in zip(
+            self.active_customers, thresholds
+        ):
+            order, tweet = customer.sim_day(day, p_buy_threshold, p_tweet_threshold)
             yield order, tweet
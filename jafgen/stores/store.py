@@ -3,12 +3,9 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Iterator, NewType
 
-from faker import Faker
-
+from jafgen.fake import fake
 from jafgen.time import Day, WeekHoursOfOperation
 
-fake = Faker()
-
 StoreId = NewType("StoreId", uuid.UUID)
 
 @dataclass(frozen=True)
@@ -1,6 +1,7 @@
 import datetime as dt
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 from typing import Iterator
 
 from jafgen.curves import AnnualCurve, GrowthCurve, WeekendCurve
@@ -67,11 +68,17 @@ class Day:
     def __init__(self, date_index: int, minutes: int = 0):
         self.date_index = date_index
         self.date = self.EPOCH + dt.timedelta(days=date_index, minutes=minutes)
-        self.effects = [
-            self.SEASONAL_MONTHLY_CURVE.eval(self.date),
-            self.WEEKEND_CURVE.eval(self.date),
-            self.GROWTH_CURVE.eval(self.date),
-        ]
+        self.effects = list(self._effects_on(self.date.date()))
+
+    @classmethod
+    @cache
+    def _effects_on(cls, date: dt.date) -> tuple[float, float, float]:
+        """Evaluate the curves once per calendar date, they ignore the time of day."""
+        return (
+            cls.SEASONAL_MONTHLY_CURVE.eval(date),
+            cls.WEEKEND_CURVE.eval(date),
+            cls.GROWTH_CURVE.eval(date),
+        )
 
     def at_minute(self, minutes: int) -> "Day":
         return Day(self.date_index, minutes=minutes)
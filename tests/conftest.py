@@ -1,5 +1,6 @@
 import pytest
 
+from jafgen.stores.inventory import Inventory
 from jafgen.stores.store import Store
 from jafgen.time import (
     Day,
@@ -13,7 +14,7 @@ T_8AM = time_from_total_minutes(60 * 8)
 T_3PM = time_from_total_minutes(60 * 15)
 T_8PM = time_from_total_minutes(60 * 20)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_store() -> Store:
     """Return a pre-initialized store that can be used for tests."""
     return Store(
@@ -26,3 +27,9 @@ def default_store() -> Store:
         opened_day=Day(date_index=0, minutes=0),
         tax_rate=0.0659123,
     )
+
+
+@pytest.fixture(scope="session")
+def inventory() -> Inventory:
+    """Return the shared product inventory."""
+    return Inventory()
@@ -1,3 +1,5 @@
+import dataclasses
+
 from jafgen.stores.inventory import Inventory
 from jafgen.stores.item import ItemType
 from jafgen.stores.stock import Stock
@@ -25,15 +27,14 @@ def test_all_inventory_jaffles_are_jaffles():
 
 def test_inventory_stock_all_has_supplies():
     """Ensure all Supplies have the necessary properties"""
-    for menu_item in Stock.stock:
-        for supply in Stock.stock[menu_item]:
-            assert isinstance(supply, Supply)
+    assert all(
+        isinstance(supply, Supply)
+        for supplies in Stock.stock.values()
+        for supply in supplies
+    )
 
 
 def test_supplies_have_all_props():
     """Ensure all Supplies have the necessary properties"""
-    supply_attrs = ["id", "name", "cost", "perishable", "skus"]
-    for menu_item in Stock.stock:
-        for supply in Stock.stock[menu_item]:
-            for attr in supply_attrs:
-                assert hasattr(supply, attr)
+    supply_attrs = {"id", "name", "cost", "perishable", "skus"}
+    assert supply_attrs <= {field.name for field in dataclasses.fields(Supply)}
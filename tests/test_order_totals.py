@@ -1,3 +1,5 @@
+import pytest
+
 from jafgen.time import Day
 from jafgen.customers.customers import Customer, BrunchCrowd, RemoteWorker, Student
 from jafgen.customers.order import Order
@@ -6,37 +8,32 @@ from jafgen.stores.inventory import Inventory
 from jafgen.stores.store import Store
 
 
-def test_order_totals(default_store: Store):
+@pytest.mark.parametrize("cust_type", [RemoteWorker, BrunchCrowd, Student])
+@pytest.mark.parametrize("date_index", [0, 1, 7, 30, 365, 999])
+def test_order_totals(
+    default_store: Store,
+    inventory: Inventory,
+    cust_type: type[Customer],
+    date_index: int,
+):
     """Ensure order totals are equivalent to the sum of the item prices and tax paid."""
-    inventory = Inventory()
-    orders: list[Order] = []
-    customer_types: list[type[Customer]] = [RemoteWorker, BrunchCrowd, Student]
-    for i in range(1000):
-        for CustType in customer_types:
-            orders.append(
-                Order(
-                    customer=CustType(store=default_store),
-                    items=
-                        inventory.get_item_type(ItemType.JAFFLE, 2) +
-                        inventory.get_item_type(ItemType.BEVERAGE, 1),
-                    store=default_store,
-                    day=Day(date_index=i),
-                )
-            )
+    order = Order(
+        customer=cust_type(store=default_store),
+        items=
+            inventory.get_item_type(ItemType.JAFFLE, 2) +
+            inventory.get_item_type(ItemType.BEVERAGE, 1),
+        store=default_store,
+        day=Day(date_index=date_index),
+    )
 
-    for order in orders:
-        assert (
-            order.subtotal
-            == order.items[0].price
-            + order.items[1].price
-            + order.items[2].price
-        )
-        assert order.tax_paid == order.subtotal * order.store.tax_rate
-        assert order.total == order.subtotal + order.tax_paid
-        assert round(float(order.total), 2) == round(
-            float(order.subtotal), 2
-        ) + round(float(order.tax_paid), 2)
-        order_dict = order.to_dict()
-        assert (
-            order_dict["order_total"] == order_dict["subtotal"] + order_dict["tax_paid"]
-        )
+    assert len(order.items) == 3
+    assert order.subtotal == sum(item.price for item in order.items)
+    assert order.tax_paid == order.subtotal * order.store.tax_rate
+    assert order.total == order.subtotal + order.tax_paid
+    assert round(float(order.total), 2) == round(
+        float(order.subtotal), 2
+    ) + round(float(order.tax_paid), 2)
+    order_dict = order.to_dict()
+    assert (
+        order_dict["order_total"] == order_dict["subtotal"] + order_dict["tax_paid"]
+    )
@@ -0,0 +1,38 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from jafgen.simulation import Simulation
+
+
+def test_empty_entity_removes_stale_csv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Ensure an entity with no rows doesn't leave an earlier run's CSV behind."""
+    monkeypatch.chdir(tmp_path)
+    stale_tweets = tmp_path / "jaffle-data" / "raw_tweets.csv"
+    stale_tweets.parent.mkdir()
+    stale_tweets.write_text("id,user_id,tweeted_at,content\nold,old,old,old\n")
+
+    sim = Simulation(0, "raw")
+    assert sim.tweets == []
+    sim.save_results()
+
+    written = sorted(os.listdir(tmp_path / "jaffle-data"))
+    assert written == ["raw_products.csv", "raw_stores.csv", "raw_supplies.csv"]
+
+
+def test_failed_write_leaves_no_partial_csv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Ensure a write that fails midway cleans up its temp file."""
+    monkeypatch.chdir(tmp_path)
+    sim = Simulation(0, "raw")
+
+    def broken_writerows(*args: object) -> None:
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr("csv.DictWriter.writerows", broken_writerows)
+    with pytest.raises(RuntimeError):
+        sim.save_results()
+
+    assert os.listdir(tmp_path / "jaffle-data") == []